@@ -6,7 +6,7 @@ import { Button } from "@/components/ui/button"
 import { useAuth } from "@/lib/auth-context"
 import { getLivePrices } from "@/lib/token-prices"
 import { piSdk } from "@/lib/pi-sdk"
-import { connectPhantom, getMintBalance, TREASURY_WALLET, SOLANA_MINTS } from "@/lib/phantom-wallet"
+import { connectPhantom, getPhantomBalances, TREASURY_WALLET } from "@/lib/phantom-wallet"
 import { CONFIG } from "@/lib/config"
 
 export function AccountOverview() {
@@ -61,17 +61,11 @@ export function AccountOverview() {
       setPhantomAddress(addr)
       
       if (addr) {
-        const ertBal = await getMintBalance(addr, SOLANA_MINTS.ERT)
-        const teosBal = await getMintBalance(addr, SOLANA_MINTS.TEOS)
-        const tutBal = await getMintBalance(addr, SOLANA_MINTS.TUT)
+        const balances = await getPhantomBalances(addr)
         
-        console.log("[v0] Real balances - ERT:", ertBal?.uiAmount, "TEOS:", teosBal?.uiAmount, "TUT:", tutBal?.uiAmount)
+        console.log("[v0] Real balances - ERT:", balances.ERT, "TEOS:", balances.TEOS, "TUT:", balances.TUT)
         
-        setPhantomBalances({
-          ERT: ertBal?.uiAmount || 0,
-          TEOS: teosBal?.uiAmount || 0,
-          TUT: tutBal?.uiAmount || 0
-        })
+        setPhantomBalances(balances)
       }
     } catch (error) {
       console.error("[v0] Error connecting Phantom:", error)
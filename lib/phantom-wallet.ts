@@ -7,6 +7,11 @@ export const SOLANA_MINTS = {
   TUT: "Gvce3ukeWYDprBeVtYrqUVdgMcRGADWSkX5vCKMQG3b5"
 }
 
+// Reverse lookup used to label token accounts returned by the RPC
+const MINT_SYMBOLS: Record<string, string> = Object.fromEntries(
+  Object.entries(SOLANA_MINTS).map(([symbol, mint]) => [mint, symbol])
+)
+
 export const TREASURY_WALLET = "F1YLmukcxAyZj6zVpi2XaVctmYnuZQB5uHpd3uUpXxr6"
 
 type TokenBalance = {
@@ -68,10 +73,7 @@ export async function getAllSplBalances(walletAddress: string): Promise<TokenBal
 
     return list.map(tb => ({
       ...tb,
-      symbol:
-        tb.mint === SOLANA_MINTS.ERT ? "ERT" :
-        tb.mint === SOLANA_MINTS.TEOS ? "TEOS" :
-        tb.mint === SOLANA_MINTS.TUT ? "TUT" : undefined
+      symbol: MINT_SYMBOLS[tb.mint]
     }))
   } catch (error) {
     console.error("[v0] Error fetching SPL balances:", error)
@@ -96,17 +98,20 @@ export async function getMintBalance(walletAddress: string, mintAddress: string)
       })
     })
     const json = await res.json()
-    const acc = json?.result?.value?.[0]
-    const info = acc?.account?.data?.parsed?.info
-    if (!info) return null
+    const accounts: any[] = json?.result?.value || []
+    if (accounts.length === 0) return null
 
-    const amount = Number(info?.tokenAmount?.amount || 0)
-    const decimals = Number(info?.tokenAmount?.decimals || 0)
-    const uiAmount = Number(info?.tokenAmount?.uiAmount || 0)
-    const symbol =
-      mintAddress === SOLANA_MINTS.ERT ? "ERT" :
-      mintAddress === SOLANA_MINTS.TEOS ? "TEOS" :
-      mintAddress === SOLANA_MINTS.TUT ? "TUT" : undefined
+    // A wallet can hold the same mint in several token accounts, so total them
+    let amount = 0
+    let decimals = 0
+    let uiAmount = 0
+    for (const acc of accounts) {
+      const info = acc?.account?.data?.parsed?.info
+      amount += Number(info?.tokenAmount?.amount || 0)
+      decimals = Number(info?.tokenAmount?.decimals || decimals)
+      uiAmount += Number(info?.tokenAmount?.uiAmount || 0)
+    }
+    const symbol = MINT_SYMBOLS[mintAddress]
 
     return { mint: mintAddress, amount, decimals, uiAmount, symbol }
   } catch (error) {
@@ -117,9 +122,12 @@ export async function getMintBalance(walletAddress: string, mintAddress: string)
 
 export async function getPhantomBalances(address: string): Promise<{ ERT: number; TEOS: number; TUT: number }> {
   try {
-    const ert = await getMintBalance(address, SOLANA_MINTS.ERT)
-    const teos = await getMintBalance(address, SOLANA_MINTS.TEOS)
-    const tut = await getMintBalance(address, SOLANA_MINTS.TUT)
+    // Independent RPC lookups, so fetch them in parallel
+    const [ert, teos, tut] = await Promise.all([
+      getMintBalance(address, SOLANA_MINTS.ERT),
+      getMintBalance(address, SOLANA_MINTS.TEOS),
+      getMintBalance(address, SOLANA_MINTS.TUT),
+    ])
     
     return {
       ERT: ert?.uiAmount || 0,
@@ -134,21 +134,22 @@ export async function getPiWalletData(username: string): Promise<PiWalletData> {
     }
     
     // If no cached data, return structure with zeros (real = 0 until fetched)
+    const now = new Date().toISOString()
     return {
       balance: 0,
       staking: {
         amount: 0,
         apy: 8.5,
-        startDate: new Date().toISOString()
+        startDate: now
       },
       mining: {
         active: false,
         rate: 0,
-        lastMined: new Date().toISOString()
+        lastMined: now
       },
       securityCircle: {
         members: 0,
-        lastUpdated: new Date().toISOString()
+        lastUpdated: now
       },
       transactions: []
     }
@@ -105,50 +105,52 @@ export class TokenPriceService {
       const ertPerPi = TOKEN_CONFIG.conversion.pi_to_ert
       const ertUsd = piUsd / ertPerPi
 
+      // One timestamp for the whole snapshot
+      const now = new Date()
       const prices: AllTokenPrices & { timestamp: number } = {
         PI: {
           usd: piUsd,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "coingecko",
         },
         ERT: {
           usd: ertUsd,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "calculated",
         },
         TUT: {
           usd: tutPrice,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "dexlab",
         },
         USD: {
           usd: usdEgp,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "fx",
         },
         USDT: {
           usd: usdtUsd,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "coingecko",
         },
         TEOS: {
           usd: teosPrice,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "dexlab",
         },
         CUSTOM_A: {
           usd: customAPrice,
           change24h: 0,
-          lastUpdated: new Date(),
+          lastUpdated: now,
           source: "dexlab",
         },
-        timestamp: Date.now(),
+        timestamp: now.getTime(),
       }
 
       // Cache the results
@@ -160,12 +162,13 @@ export class TokenPriceService {
     } catch (error) {
       console.error("[v0] Failed to fetch token prices:", error)
       // Return fallback prices
+      const now = new Date()
       return {
-        PI: { usd: 0.5, change24h: 0, lastUpdated: new Date(), source: "fallback" },
-        ERT: { usd: 0.1, change24h: 0, lastUpdated: new Date(), source: "fallback" },
-        TUT: { usd: 0, change24h: 0, lastUpdated: new Date(), source: "fallback" },
-        USD: { usd: 1.0, change24h: 0, lastUpdated: new Date(), source: "fallback" },
-        USDT: { usd: 0.999, change24h: 0, lastUpdated: new Date(), source: "fallback" },
+        PI: { usd: 0.5, change24h: 0, lastUpdated: now, source: "fallback" },
+        ERT: { usd: 0.1, change24h: 0, lastUpdated: now, source: "fallback" },
+        TUT: { usd: 0, change24h: 0, lastUpdated: now, source: "fallback" },
+        USD: { usd: 1.0, change24h: 0, lastUpdated: now, source: "fallback" },
+        USDT: { usd: 0.999, change24h: 0, lastUpdated: now, source: "fallback" },
       }
     }
   }
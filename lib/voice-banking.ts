@@ -3,15 +3,26 @@ export interface VoiceCommand {
   details: string
 }
 
+// Checked in order; the first intent with a matching keyword wins
+const INTENT_KEYWORDS: { action: string; keywords: string[] }[] = [
+  { action: 'Transfer Dana', keywords: ['transfer', 'kirim'] },
+  { action: 'Cek Saldo', keywords: ['saldo', 'balance'] },
+  { action: 'Lihat Riwayat', keywords: ['riwayat', 'history'] },
+  { action: 'Tukar Token', keywords: ['tukar', 'swap'] },
+]
+
 export class VoiceBankingService {
   private apiUrl: string
   private recognition: any
 
   constructor(apiUrl: string = process.env.NEXT_PUBLIC_VOICE_API_URL || 'http://localhost:8000') {
     this.apiUrl = apiUrl
-    
-    // Initialize Web Speech API for browser
-    if (typeof window !== 'undefined') {
+  }
+
+  // Create the Web Speech API recognizer on first use rather than when the
+  // module is imported, so pages that never use voice commands skip it
+  private getRecognition(): any {
+    if (!this.recognition && typeof window !== 'undefined') {
       const SpeechRecognition = (window as any).SpeechRecognition || (window as any).webkitSpeechRecognition
       if (SpeechRecognition) {
         this.recognition = new SpeechRecognition()
@@ -20,11 +31,12 @@ export class VoiceBankingService {
         this.recognition.interimResults = false
       }
     }
+    return this.recognition
   }
 
   async startListening(): Promise<string> {
     return new Promise((resolve, reject) => {
-      if (!this.recognition) {
+      if (!this.getRecognition()) {
         reject(new Error('Speech recognition not supported'))
         return
       }
@@ -46,32 +58,13 @@ export class VoiceBankingService {
     try {
       // For now, simple client-side intent detection
       const lowerCommand = command.toLowerCase()
-      
-      if (lowerCommand.includes('transfer') || lowerCommand.includes('kirim')) {
-        return {
-          action: 'Transfer Dana',
-          details: command
-        }
-      } else if (lowerCommand.includes('saldo') || lowerCommand.includes('balance')) {
-        return {
-          action: 'Cek Saldo',
-          details: command
-        }
-      } else if (lowerCommand.includes('riwayat') || lowerCommand.includes('history')) {
-        return {
-          action: 'Lihat Riwayat',
-          details: command
-        }
-      } else if (lowerCommand.includes('tukar') || lowerCommand.includes('swap')) {
-        return {
-          action: 'Tukar Token',
-          details: command
-        }
-      } else {
-        return {
-          action: 'Tidak Diketahui',
-          details: command
-        }
+      const intent = INTENT_KEYWORDS.find(({ keywords }) =>
+        keywords.some((keyword) => lowerCommand.includes(keyword))
+      )
+
+      return {
+        action: intent ? intent.action : 'Tidak Diketahui',
+        details: command
       }
     } catch (error) {
       throw new Error('Failed to process voice command')